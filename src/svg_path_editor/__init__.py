@@ -8,7 +8,7 @@ from .geometry import Point
 from .math import Precision
 from .path_change_origin import change_path_origin
 from .path_offset import BevelArced, BevelPolygon, bevel_path, offset_path
-from .path_operations import optimize_path, reverse_path
+from .path_operations import optimize_path, reverse_path, simplify_arcs
 from .path_round_corners import round_corners
 from .path_shade import (
     PNG,
@@ -43,4 +43,5 @@ __all__ = [
     "reverse_path",
     "round_corners",
     "shade_path",
+    "simplify_arcs",
 ]
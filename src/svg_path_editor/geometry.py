@@ -67,9 +67,12 @@ def rotation_matrix(phi: Expr) -> Mat2:
 class Point:
     """2D point with :class:`decimal.Decimal` coordinates."""
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: Number, y: Number) -> None:
-        self.x: Decimal = Decimal(x)
-        self.y: Decimal = Decimal(y)
+        # Most points are created from existing Decimals; skip the constructor call.
+        self.x: Decimal = x if type(x) is Decimal else Decimal(x)
+        self.y: Decimal = y if type(y) is Decimal else Decimal(y)
 
     def __iter__(self) -> Iterator[Decimal]:
         """Iterate as ``(x, y)``."""
@@ -218,9 +221,13 @@ class Vec2:
         """
         import sympy as sp
 
-        if isinstance(other, Vec2):
-            return as_bool(sp.And(eq(self.x, other.x), eq(self.y, other.y)))
-        return False
+        if not isinstance(other, Vec2):
+            return False
+        coords = (self.x, self.y, other.x, other.y)
+        if all(isinstance(v, sp.Rational) for v in coords):
+            # Rationals are canonical, so structural equality is exact.
+            return self.x == other.x and self.y == other.y
+        return as_bool(sp.And(eq(self.x, other.x), eq(self.y, other.y)))
 
     @override
     def __ne__(self, value: object, /) -> bool:
@@ -8,7 +8,8 @@ from __future__ import annotations
 
 from collections import Counter
 from dataclasses import dataclass
-from decimal import Decimal, getcontext
+from decimal import Decimal, Inexact, getcontext, localcontext
+from functools import lru_cache
 from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
@@ -56,17 +57,19 @@ def canonical_decimal(x: Decimal) -> Decimal:
     return Decimal(0) if x == 0 else x.normalize()
 
 
+@lru_cache(maxsize=4096)
 def dec_to_rat(x: Decimal) -> Expr:
     """
     Convert a :class:`~decimal.Decimal` to a SymPy :class:`sympy.Rational`.
 
     The conversion is exact with respect to the decimal representation:
-    the :class:`~decimal.Decimal` is first converted to a string and then
-    passed to :class:`sympy.Rational`.
+    the numerator and denominator of the :class:`~decimal.Decimal` are
+    passed to :class:`sympy.Rational`. Equal values yield the same rational
+    independently of the context, so results are cached.
     """
     import sympy as sp
 
-    return sp.Rational(str(x))
+    return sp.Rational(*x.as_integer_ratio())
 
 
 def rat_to_dec(x: Expr) -> Decimal:
@@ -77,6 +80,14 @@ def rat_to_dec(x: Expr) -> Decimal:
     with ``n = getcontext().prec`` and then converted to :class:`~decimal.Decimal`.
     The result is normalized via :func:`canonical_decimal`.
     """
+    if x.is_Rational:
+        # Rationals whose quotient is exact at the current precision are divided
+        # directly, which yields the same value as the numerical evaluation.
+        with localcontext() as ctx:
+            ctx.clear_flags()
+            q = Decimal(int(x.p)) / Decimal(int(x.q))
+            if not ctx.flags[Inexact]:
+                return canonical_decimal(q)
     return canonical_decimal(Decimal(str(x.evalf(n=getcontext().prec))))
 
 
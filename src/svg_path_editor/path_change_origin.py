@@ -6,7 +6,7 @@
 
 from __future__ import annotations
 
-from .path_operations import optimize_path
+from .path_operations import _optimize_path_in_place
 from .sub_path_bounds import get_sub_path_bounds
 from .svg import SvgItem, SvgPath
 
@@ -122,8 +122,8 @@ def change_path_origin(
         # Restore relativity of the first item after the modified segment.
         new_svg.path[start + len(output_path)].relative = True
 
-    # Optimize representation of the resulting path.
-    return optimize_path(
+    # Optimize representation of the resulting path (owned by us, so in place).
+    return _optimize_path_in_place(
         new_svg,
         remove_useless_commands=True,
         use_shorthands=True,
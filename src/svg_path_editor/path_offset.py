@@ -68,23 +68,23 @@ def _prepare_offset_data(
 
     # Absolute vertex positions (omit final Z).
     pts = [it.target_location.vec2 for it in items[:-1]]
-    n = len(pts)
-    assert n >= 2, "Path must contain at least one segment."
+    assert len(pts) >= 2, "Path must contain at least one segment."
 
     # Negative signed area ⇒ CCW polygon.
     is_ccw = polygon_signed_area(pts) < 0
 
-    # Offset each segment (cyclic).
+    # Offset each segment (cyclic); the last one returns to the first vertex.
     offsets = [
         it.to_geometry(n=oprec).offset(d=δ, is_ccw=is_ccw, n=oprec)
-        if isinstance(it := items[i + 1], EllipticalArcTo)
-        else Line(pts[i], pts[(i + 1) % n]).offset(d=δ, is_ccw=is_ccw, n=oprec)
-        for i in range(n)
+        if isinstance(it, EllipticalArcTo)
+        else Line(p0, p1).offset(d=δ, is_ccw=is_ccw, n=oprec)
+        for p0, p1, it in zip(pts, [*pts[1:], pts[0]], items[1:])
     ]
 
     # Intersections between consecutive offset segments (cyclic).
     inters: list[Intersection | None] = [
-        intersect(offsets[i - 1], offsets[i], d=d, n=iprec) for i in range(n)
+        intersect(o0, o1, d=d, n=iprec)
+        for o0, o1 in zip([offsets[-1], *offsets[:-1]], offsets)
     ]
     assert _all_non_none(inters), "Offset intersection computation failed."
 
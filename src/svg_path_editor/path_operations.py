@@ -4,12 +4,38 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-from typing import Final
+import re
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Final, NamedTuple
 
+from .math import Number
 from .sub_path_bounds import get_sub_path_bounds
-from .svg import Point, SvgItem, SvgPath
-
-__all__ = ["reverse_path", "optimize_relative_absolute", "optimize_path"]
+from .svg import (
+    CurveTo,
+    EllipticalArcTo,
+    HorizontalLineTo,
+    L,
+    LineTo,
+    M,
+    Point,
+    QuadraticBezierCurveTo,
+    SmoothCurveTo,
+    SmoothQuadraticBezierCurveTo,
+    SvgItem,
+    SvgPath,
+    VerticalLineTo,
+    Z,
+    _group_type,
+    _minify_group,
+)
+
+__all__ = [
+    "reverse_path",
+    "optimize_relative_absolute",
+    "optimize_path",
+    "simplify_arcs",
+]
 
 
 def _to_str(pt: Point) -> tuple[str, str]:
@@ -17,6 +43,58 @@ def _to_str(pt: Point) -> tuple[str, str]:
     return str(pt.x), str(pt.y)
 
 
+type _ReverseBuilder = Callable[[SvgItem, str], SvgItem]
+
+
+def _reverse_curve(it: SvgItem, previous_type: str) -> SvgItem:
+    # Swap control points when reversing cubic Bézier.
+    (c0x, c0y), (c1x, c1y), _ = it.absolute_points
+    return CurveTo([c1x, c1y, c0x, c0y, *it.previous_point], relative=False)
+
+
+def _reverse_smooth_curve(it: SvgItem, previous_type: str) -> SvgItem:
+    # For smooth cubic, we may need to expand to C depending on the previous command.
+    (cx, cy), _ = it.absolute_points
+    ax, ay = it.control_locations[0]
+    if previous_type != "S":
+        return CurveTo([cx, cy, ax, ay, *it.previous_point], relative=False)
+    return SmoothCurveTo([ax, ay, *it.previous_point], relative=False)
+
+
+def _reverse_quadratic(it: SvgItem, previous_type: str) -> SvgItem:
+    (cx, cy), _ = it.absolute_points
+    return QuadraticBezierCurveTo([cx, cy, *it.previous_point], relative=False)
+
+
+def _reverse_smooth_quadratic(it: SvgItem, previous_type: str) -> SvgItem:
+    # For smooth quadratic, we may need to expand to Q.
+    if previous_type != "T":
+        ax, ay = it.control_locations[0]
+        return QuadraticBezierCurveTo([ax, ay, *it.previous_point], relative=False)
+    return SmoothQuadraticBezierCurveTo([*it.previous_point], relative=False)
+
+
+def _reverse_arc(it: SvgItem, previous_type: str) -> SvgItem:
+    # Reverse arc: keep radii/angle/large-arc, flip sweep, swap endpoints.
+    rx, ry, angle, large_arc, sweep, _, _ = it.values
+    return EllipticalArcTo(
+        [rx, ry, angle, large_arc, 1 - sweep, *it.previous_point], relative=False
+    )
+
+
+_reverse_builders: Final[dict[str, _ReverseBuilder]] = {
+    "L": lambda it, _: L(*it.previous_point),
+    "H": lambda it, _: HorizontalLineTo([it.previous_point.x], relative=False),
+    "V": lambda it, _: VerticalLineTo([it.previous_point.y], relative=False),
+    "C": _reverse_curve,
+    "S": _reverse_smooth_curve,
+    "Q": _reverse_quadratic,
+    "T": _reverse_smooth_quadratic,
+    "A": _reverse_arc,
+}
+"""Builders for the reversed form of each drawing command (``M``/``Z`` excluded)."""
+
+
 def reverse_path(svg: SvgPath, subpath_of_item: int | None = None) -> SvgPath:
     """
     Reverse the drawing direction of a path or sub-path.
@@ -49,64 +127,31 @@ def reverse_path(svg: SvgPath, subpath_of_item: int | None = None) -> SvgPath:
     output_path: list[SvgItem] = []
     reversed_path = list(reversed(sub_path))[:-1]
 
-    start_point = reversed_path[0].target_location
-    output_path.append(SvgItem.make(["M", *_to_str(start_point)]))
+    output_path.append(M(*reversed_path[0].target_location))
     previous_type = ""
     is_closed = False
 
     for component in reversed_path:
-        pt = _to_str(component.previous_point)
-        ctrl = [_to_str(p) for p in component.absolute_points]
         component_type = component.get_type(True)
 
-        match component_type:
-            case "M" | "Z":
-                if is_closed:
-                    output_path.append(SvgItem.make(["Z"]))
-                is_closed = component_type == "Z"
-                if output_path[-1].get_type(True) == "M":
-                    output_path[-1] = SvgItem.make(["M", *pt])
-                else:
-                    output_path.append(SvgItem.make(["M", *pt]))
-            case "L":
-                output_path.append(SvgItem.make(["L", *pt]))
-            case "H":
-                output_path.append(SvgItem.make(["H", pt[0]]))
-            case "V":
-                output_path.append(SvgItem.make(["V", pt[1]]))
-            case "C":
-                # Swap control points when reversing cubic Bézier.
-                output_path.append(SvgItem.make(["C", *ctrl[1], *ctrl[0], *pt]))
-            case "S":
-                # For smooth cubic, we may need to expand to C depending
-                # on the previous command.
-                a = _to_str(component.control_locations[0])
-                if previous_type != "S":
-                    output_path.append(SvgItem.make(["C", *ctrl[0], *a, *pt]))
-                else:
-                    output_path.append(SvgItem.make(["S", *a, *pt]))
-            case "Q":
-                output_path.append(SvgItem.make(["Q", *ctrl[0], *pt]))
-            case "T":
-                # For smooth quadratic, we may need to expand to Q.
-                if previous_type != "T":
-                    a = _to_str(component.control_locations[0])
-                    output_path.append(SvgItem.make(["Q", *a, *pt]))
-                else:
-                    output_path.append(SvgItem.make(["T", *pt]))
-            case "A":
-                # Reverse arc: keep radii/angle/large-arc, flip sweep, swap endpoints.
-                vals = [str(v) for v in component.values[:4]]
-                sweep = str(1 - component.values[4])
-                output_path.append(SvgItem.make(["A", *vals, sweep, *pt]))
-            case _:
-                # Unsupported/unknown types result in an error being thrown.
-                raise ValueError(f"Invalid command type: {component_type}")
+        if component_type in ("M", "Z"):
+            if is_closed:
+                output_path.append(Z())
+            is_closed = component_type == "Z"
+            if output_path[-1].get_type(True) == "M":
+                output_path[-1] = M(*component.previous_point)
+            else:
+                output_path.append(M(*component.previous_point))
+        elif (builder := _reverse_builders.get(component_type)) is not None:
+            output_path.append(builder(component, previous_type))
+        else:
+            # Unsupported/unknown types result in an error being thrown.
+            raise ValueError(f"Invalid command type: {component_type}")
 
         previous_type = component_type
 
     if is_closed:
-        output_path.append(SvgItem.make(["Z"]))
+        output_path.append(Z())
 
     new_svg.path = [*path[:start], *output_path, *path[end:]]
     new_svg.refresh_absolute_positions()
@@ -116,44 +161,133 @@ def reverse_path(svg: SvgPath, subpath_of_item: int | None = None) -> SvgPath:
         new_svg.path[start + len(output_path)].relative = True
 
     # Optimize the new path to keep representation compact.
-    return optimize_path(
+    # `new_svg` is private to this function, so it can be optimized in place.
+    return _optimize_path_in_place(
         new_svg,
         remove_useless_commands=True,
         use_shorthands=True,
     )
 
 
-def optimize_relative_absolute(svg: SvgPath) -> SvgPath:
+_fraction_end: Final = re.compile(r"\.[0-9]+$")
+
+
+class _MinifiedItem(NamedTuple):
     """
-    Optimize the relative/absolute representation of a path.
+    Minified serialization of a single item.
 
-    Each command is toggled between relative and absolute form, and the
-    representation that yields a shorter minified path string is kept.
+    :ivar type: Command type (case-sensitive).
+    :ivar body: Minified values without the command letter.
+    :ivar fraction_end: Whether ``body`` ends in a fractional part, so that a
+        following value starting with ``.`` needs no separator.
+    """
 
-    :param svg: Input path.
+    type: str
+    body: str
+    fraction_end: bool
 
-    :return:
-        A new path with possibly changed relative/absolute commands.
-        Geometry is preserved; only representation changes.
+
+def _minified_item(it: SvgItem) -> _MinifiedItem:
+    body = _minify_group(it.as_string(minify=True))[1:]
+    return _MinifiedItem(it.get_type(), body, _fraction_end.search(body) is not None)
+
+
+def _minified_length(prev: _MinifiedItem | None, cur: _MinifiedItem) -> int:
     """
-    new_svg = svg.clone()
-    length = len(new_svg.as_string(minify=True))
+    Return the number of characters ``cur`` adds to the minified path string.
+
+    This mirrors :meth:`SvgPath.as_string`, in which an item only depends on its
+    predecessor: it either starts a new group or is appended to the group of
+    ``prev``, separated by a space unless the space can be dropped.
+    """
+    if prev is None or _group_type(prev.type) != cur.type:
+        return 1 + len(cur.body)
+    if not cur.body:
+        return 0
+    start = cur.body[0]
+    needs_space = start != "-" and not (start == "." and prev.fraction_end)
+    return len(cur.body) + needs_space
+
+
+def _replacement_delta(
+    prev_item: _MinifiedItem | None,
+    old_item: _MinifiedItem,
+    new_item: _MinifiedItem,
+    next_item: _MinifiedItem | None,
+) -> int:
+    """
+    Return the change in minified length when replacing ``old`` by ``new``.
+
+    Only the contributions of the replaced item and its successor change.
+    """
+    delta = _minified_length(prev_item, new_item)
+    delta -= _minified_length(prev_item, old_item)
+    if next_item is not None:
+        delta += _minified_length(new_item, next_item)
+        delta -= _minified_length(old_item, next_item)
+    return delta
+
+
+def _optimize_relative_absolute_in_place(svg: SvgPath) -> int:
+    """
+    Optimize the relative/absolute representation of ``svg`` in place.
+
+    :return: The length of the minified representation of the optimized path.
+    """
+    path = svg.path
+    items = [_minified_item(it) for it in path]
+    current = sum(
+        _minified_length(items[i - 1] if i > 0 else None, cur)
+        for i, cur in enumerate(items)
+    )
+    # The length of the last accepted representation. Toggling an item back can
+    # still change its serialization (e.g. by normalizing negative zeros), so this
+    # may differ from the current length, which is tracked as well.
+    length = current
     origin: Final[Point] = Point(0, 0)
 
-    for i, comp in enumerate(new_svg.path):
-        previous = new_svg.path[i - 1] if i > 0 else None
+    for i, comp in enumerate(path):
+        previous = path[i - 1] if i > 0 else None
         if comp.get_type(True) == "Z":
             continue
 
-        # Toggle relativity and test string length.
+        # Toggle relativity and compare the lengths of the affected items only.
+        prev_item = items[i - 1] if i > 0 else None
+        next_item = items[i + 1] if i + 1 < len(items) else None
+        old_item = items[i]
         comp.relative = not comp.relative
-        new_length = len(new_svg.as_string(minify=True))
+        new_item = _minified_item(comp)
+        new_length = current + _replacement_delta(
+            prev_item, old_item, new_item, next_item
+        )
+
         if new_length < length:
-            length = new_length
+            length = current = new_length
             comp.refresh(origin, previous)
         else:
             comp.relative = not comp.relative
+            new_item = _minified_item(comp)
+            current += _replacement_delta(prev_item, old_item, new_item, next_item)
+        items[i] = new_item
+
+    return current
+
+
+def optimize_relative_absolute(svg: SvgPath) -> SvgPath:
+    """
+    Optimize the relative/absolute representation of a path.
 
+    Each command is toggled between relative and absolute form, and the
+    representation that yields a shorter minified path string is kept.
+
+    :param svg: Input path.
+
+    :return:
+        A new path with possibly changed relative/absolute commands.
+        Geometry is preserved; only representation changes.
+    """
+    new_svg = svg.clone()
+    _optimize_relative_absolute_in_place(new_svg)
     return new_svg
 
 
@@ -195,123 +329,226 @@ def optimize_path(
 
     :return: A new, possibly shorter, but geometrically equivalent path.
     """
-    new_svg = svg.clone()
-    path = new_svg.path
+    return _optimize_path_in_place(
+        svg.clone(),
+        remove_useless_commands=remove_useless_commands,
+        remove_orphan_dots=remove_orphan_dots,
+        use_shorthands=use_shorthands,
+        use_horizontal_and_vertical_lines=use_horizontal_and_vertical_lines,
+        use_relative_absolute=use_relative_absolute,
+        use_reverse=use_reverse,
+        use_close_path=use_close_path,
+    )
+
+
+def _optimize_path_in_place(
+    svg: SvgPath,
+    *,
+    remove_useless_commands: bool = False,
+    remove_orphan_dots: bool = False,
+    use_shorthands: bool = False,
+    use_horizontal_and_vertical_lines: bool = False,
+    use_relative_absolute: bool = False,
+    use_reverse: bool = False,
+    use_close_path: bool = False,
+) -> SvgPath:
+    """
+    Implementation of :func:`optimize_path` that may modify ``svg``.
+
+    Callers that already own a freshly refreshed path (e.g. :func:`reverse_path`)
+    use this to avoid an additional clone and refresh.
+    """
     origin: Final[Point] = Point(0, 0)
     initial_pt = Point(0, 0)
 
-    i = 1
-    while i < len(path):
-        c0 = path[i - 1]
-        c1 = path[i]
+    # Build the optimized path in a single forward pass: `path` holds the items
+    # kept so far and `pending` the items still to consider (in reverse order,
+    # so that popping the next one is cheap). Removing an item steps back by
+    # moving the last kept item to `pending` again, which re-checks it against
+    # its new successor.
+    path: list[SvgItem] = []
+    pending = svg.path[::-1]
+    removed = False
+
+    while pending:
+        c1 = pending.pop()
+        if not path:
+            path.append(c1)
+            continue
+
+        c0 = path[-1]
         c0type = c0.get_type(True)
         c1type = c1.get_type(True)
 
+        # Look up the points of `c1` that the checks below compare only once.
+        prev_pt = c1.previous_point
+        first_pt = c1.absolute_points[0]
+        target = c1.target_location
+
         if c0type == "M":
             initial_pt = c0.target_location
 
         if remove_useless_commands:
             if c0type == "M" and c1type == "M":
                 c1.relative = False
-                del path[i - 1]
-                i -= 1
+                del path[-1]
+                pending.append(c1)
+                removed = True
                 continue
             if c0type == "Z" and c1type == "Z":
-                del path[i]
-                i -= 1
+                if len(path) > 1:
+                    pending.append(path.pop())
+                removed = True
                 continue
             if c0type == "Z" and c1type == "M":
                 tg = c0.target_location
-                if tg.x == c1.absolute_points[0].x and tg.y == c1.absolute_points[0].y:
-                    del path[i]
-                    i -= 1
+                if tg.x == first_pt.x and tg.y == first_pt.y:
+                    if len(path) > 1:
+                        pending.append(path.pop())
+                    removed = True
                     continue
             if c1type in ("L", "V", "H"):
-                tg = c1.target_location
-                if tg.x == c1.previous_point.x and tg.y == c1.previous_point.y:
-                    del path[i]
-                    i -= 1
+                if target.x == prev_pt.x and target.y == prev_pt.y:
+                    if len(path) > 1:
+                        pending.append(path.pop())
+                    removed = True
                     continue
 
         if remove_orphan_dots:
             if c0type == "M" and c1type == "Z":
-                del path[i]
-                i -= 1
+                if len(path) > 1:
+                    pending.append(path.pop())
+                removed = True
                 continue
 
         if use_horizontal_and_vertical_lines:
             if c1type == "L":
-                tg = c1.target_location
-                if tg.x == c1.previous_point.x:
-                    path[i] = SvgItem.make_from(c1, c0, "V")
-                    i += 1
+                if target.x == prev_pt.x:
+                    path.append(SvgItem.make_from(c1, c0, "V"))
                     continue
-                if tg.y == c1.previous_point.y:
-                    path[i] = SvgItem.make_from(c1, c0, "H")
-                    i += 1
+                if target.y == prev_pt.y:
+                    path.append(SvgItem.make_from(c1, c0, "H"))
                     continue
 
+        item = c1
+
         if use_shorthands:
             if c0type in ("Q", "T") and c1type == "Q":
-                pt = _to_str(path[i].target_location)
+                pt = _to_str(target)
                 candidate = SvgItem.make(["T", *pt])
                 candidate.refresh(origin, c0)
                 ctrl = candidate.control_locations
-                if (
-                    ctrl[0].x == c1.absolute_points[0].x
-                    and ctrl[0].y == c1.absolute_points[0].y
-                ):
-                    path[i] = candidate
+                if ctrl[0].x == first_pt.x and ctrl[0].y == first_pt.y:
+                    item = candidate
 
             if c0type in ("C", "S") and c1type == "C":
-                pt = _to_str(path[i].target_location)
-                ctrl = _to_str(path[i].absolute_points[1])
+                pt = _to_str(target)
+                ctrl = _to_str(c1.absolute_points[1])
                 candidate = SvgItem.make(["S", *ctrl, *pt])
                 candidate.refresh(origin, c0)
                 ctrl2 = candidate.control_locations
-                if (
-                    ctrl2[0].x == c1.absolute_points[0].x
-                    and ctrl2[0].y == c1.absolute_points[0].y
-                ):
-                    path[i] = candidate
+                if ctrl2[0].x == first_pt.x and ctrl2[0].y == first_pt.y:
+                    item = candidate
 
             if c0type not in ("C", "S") and c1type == "C":
-                if (
-                    c1.previous_point.x == c1.absolute_points[0].x
-                    and c1.previous_point.y == c1.absolute_points[0].y
-                ):
-                    pt = _to_str(c1.target_location)
+                if prev_pt.x == first_pt.x and prev_pt.y == first_pt.y:
+                    pt = _to_str(target)
                     ctrl = _to_str(c1.absolute_points[1])
-                    path[i] = SvgItem.make(["S", *ctrl, *pt])
-                    path[i].refresh(origin, c0)
+                    item = SvgItem.make(["S", *ctrl, *pt])
+                    item.refresh(origin, c0)
 
         if use_close_path:
             if c1type in ("L", "H", "V"):
-                target = c1.target_location
                 if initial_pt.x == target.x and initial_pt.y == target.y:
-                    path[i] = SvgItem.make(["Z"])
-                    path[i].refresh(initial_pt, c0)
+                    item = SvgItem.make(["Z"])
+                    item.refresh(initial_pt, c0)
 
-        i += 1
+        path.append(item)
 
     if remove_useless_commands or remove_orphan_dots:
         if len(path) > 0 and path[-1].get_type(True) == "M":
             del path[-1]
 
-        # With remove_useless_commands, links to previous items may become dirty:
-        new_svg.refresh_absolute_positions()
+    svg.path = path
+    if removed:
+        # Removing items makes the links to previous items dirty.
+        svg.refresh_absolute_positions()
 
+    length: int | None = None
     if use_relative_absolute:
-        new_svg = optimize_relative_absolute(new_svg)
+        length = _optimize_relative_absolute_in_place(svg)
 
     if use_reverse:
-        length = len(new_svg.as_string(minify=True))
-        non_reversed = new_svg.clone()
-        new_svg = reverse_path(new_svg)
+        if length is None:
+            length = len(svg.as_string(minify=True))
+        # `reverse_path` does not modify its input, so no defensive copy is needed.
+        non_reversed = svg
+        svg = reverse_path(svg)
         if use_relative_absolute:
-            new_svg = optimize_relative_absolute(new_svg)
-        after_length = len(new_svg.as_string(minify=True))
+            after_length = _optimize_relative_absolute_in_place(svg)
+        else:
+            after_length = len(svg.as_string(minify=True))
         if after_length >= length:
-            new_svg = non_reversed
+            svg = non_reversed
+
+    return svg
+
+
+def _arc_is_flat(arc: EllipticalArcTo, tolerance: Decimal) -> bool:
+    """
+    Check whether an arc deviates from its chord by at most ``tolerance``.
+
+    The curvature of an ellipse with radii ``a >= b`` is at most ``a / b²``, so a
+    small arc is no farther from its chord than a circular arc with radius
+    ``ρ = b² / a`` and the same chord. Chords longer than ``2ρ`` are rejected,
+    which also guarantees that the radii do not need to be scaled up.
 
+    :param arc: Refreshed arc item.
+    :param tolerance: Maximum allowed distance between the arc and its chord.
+    """
+    rx, ry, _, large_arc, _, _, _ = arc.values
+    rx, ry = abs(rx), abs(ry)
+    # Arcs with a zero radius are drawn as straight lines
+    if rx == 0 or ry == 0:
+        return True
+    if large_arc != 0:
+        return False
+
+    start, end = arc.previous_point, arc.target_location
+    dx, dy = end.x - start.x, end.y - start.y
+    half_chord_sq = (dx * dx + dy * dy) / 4
+    rho = min(rx, ry) ** 2 / max(rx, ry)
+    if half_chord_sq > rho * rho:
+        return False
+    return rho - (rho * rho - half_chord_sq).sqrt() <= tolerance
+
+
+def simplify_arcs(svg: SvgPath, tolerance: Number) -> SvgPath:
+    """
+    Replace elliptical arcs that are almost straight by lines.
+
+    An arc is replaced if it has a zero radius or if it is a small arc whose
+    distance from its chord is provably at most ``tolerance``. Unlike the passes
+    of :func:`optimize_path`, this changes the geometry of the path, but later
+    transformations such as non-uniform scaling no longer need the expensive
+    arc computations for the replaced items.
+
+    :param svg: Input path.
+    :param tolerance: Maximum allowed distance between a replaced arc and its line.
+
+    :return: A new path in which flat arcs are replaced by ``L``/``l`` commands.
+    """
+    tolerance = Decimal(tolerance)
+    new_svg = svg.clone()
+    path = new_svg.path
+
+    # Replacing an arc by a line keeps its target, so all other items stay valid
+    # and a single refresh at the end suffices.
+    for idx in range(1, len(path)):
+        it = path[idx]
+        if isinstance(it, EllipticalArcTo) and _arc_is_flat(it, tolerance):
+            new_type = LineTo.key.lower() if it.relative else LineTo.key
+            path[idx] = SvgItem.make_from(it, path[idx - 1], new_type)
+
+    new_svg.refresh_absolute_positions()
     return new_svg
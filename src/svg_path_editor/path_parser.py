@@ -9,11 +9,13 @@ from typing import Final
 
 __all__ = ["PathParser"]
 
-_cmd_type_re: Final = re.compile(r"^[\t\n\f\r ]*([MLHVZCSQTAmlhvzcsqta])[\t\n\f\r ]*")
-_flag_re: Final = re.compile(r"^[01]")
-_number_re: Final = re.compile(r"^[+-]?((\d*\.\d+)|(\d+\.)|(\d+))([eE][+-]?\d+)?")
+# Matched via ``Pattern.match(path, cursor)``, which anchors each pattern at the
+# cursor without copying the remainder of the path.
+_cmd_type_re: Final = re.compile(r"[\t\n\f\r ]*([MLHVZCSQTAmlhvzcsqta])[\t\n\f\r ]*")
+_flag_re: Final = re.compile(r"[01]")
+_number_re: Final = re.compile(r"[+-]?((\d*\.\d+)|(\d+\.)|(\d+))([eE][+-]?\d+)?")
 _coord_re: Final = _number_re
-_comma_wsp: Final = re.compile(r"^(([\t\n\f\r ]+,?[\t\n\f\r ]*)|(,[\t\n\f\r ]*))")
+_comma_wsp: Final = re.compile(r"(([\t\n\f\r ]+,?[\t\n\f\r ]*)|(,[\t\n\f\r ]*))")
 
 grammar: Final = {
     "M": [_coord_re, _coord_re],
@@ -61,13 +63,12 @@ class PathParser:
         while cursor <= len(path):
             component: list[str] = [cmd_type]
             for regex in expected_regex_list:
-                segment = path[cursor:]
-                match = regex.match(segment)
+                match = regex.match(path, cursor)
                 if match is not None:
                     text = match.group(0)
                     component.append(text)
                     cursor += len(text)
-                    ws_match = _comma_wsp.match(path[cursor:])
+                    ws_match = _comma_wsp.match(path, cursor)
                     if ws_match is not None:
                         cursor += len(ws_match.group(0))
                 elif len(component) == 1 and len(components) >= 1:
@@ -99,7 +100,7 @@ class PathParser:
         cursor = 0
         tokens: list[list[str]] = []
         while cursor < len(path):
-            match = _cmd_type_re.match(path[cursor:])
+            match = _cmd_type_re.match(path, cursor)
             if match is None:
                 raise ValueError(f"malformed path (first error at {cursor})")
 
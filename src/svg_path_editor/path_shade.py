@@ -203,22 +203,27 @@ def lambert_shading_base64(
     # Threshold-based grayscale + symmetric alpha remap
     mask = intensity > t
 
-    alpha = intensity.copy()
+    # `intensity` is not needed anymore, so remap it in place
+    alpha = intensity
     alpha[mask] = (alpha[mask] - t) / (1.0 - t)
     alpha[~mask] = (t - alpha[~mask]) / t
 
     # Quantize alpha to 8-bit with small dithering noise
     w = np.iinfo(np.uint8).max
-    noise = np.random.default_rng(seed).uniform(0.0, 1.0, size=alpha.shape)
-    alpha = (alpha * w + noise).clip(0, w).astype(np.uint8)
+    # `random` draws the same values as `uniform(0.0, 1.0)` without rescaling them
+    noise = np.random.default_rng(seed).random(alpha.shape)
+    alpha *= w
+    alpha += noise
+    alpha = alpha.clip(0, w, out=alpha).astype(np.uint8)
 
     gray = mask.astype(np.uint8) * 255
     rgba = np.dstack([gray, gray, gray, alpha])
     img_bytes = format.encode(rgba)
     assert isinstance(img_bytes, bytes)
 
-    b64 = base64.b64encode(img_bytes).decode("ascii")
-    return img_bytes, f"data:{format.media_type};base64," + b64
+    # Decode the (potentially large) payload once and concatenate it directly
+    prefix = "data:" + format.media_type + ";base64,"
+    return img_bytes, prefix + base64.b64encode(img_bytes).decode("ascii")
 
 
 @dataclass
@@ -305,6 +310,9 @@ def shade_path(
     defs_body: list[str] = []
     body: list[str] = []
 
+    # The opacity of the textures is the same for all arcs.
+    opacity_attr = f' opacity="{max_opacity:.3g}"' if max_opacity != 1 else ""
+
     clip_idx = 0
     for b in bevels:
         match b:
@@ -346,8 +354,8 @@ def shade_path(
                     # Base <image> in <defs> at (0, 0) with size 2 r.x × 2 r.y.
                     defs_body.append(
                         f'<image id="{image_id}" '
-                        + f'width="{d2s(dims.x)}" height="{d2s(dims.y)}" '
-                        + f'preserveAspectRatio="none" href="{base64}"/>'
+                        f'width="{d2s(dims.x)}" height="{d2s(dims.y)}" '
+                        f'preserveAspectRatio="none" href="{base64}"/>'
                     )
                 else:
                     image_id, base64 = img_entry
@@ -363,14 +371,10 @@ def shade_path(
                     )
                 transform_attr = " ".join(transform_parts)
 
-                opacity_attr = (
-                    f' opacity="{max_opacity:.3g}"' if max_opacity != 1 else ""
-                )
-
                 body.append(
                     f'<g clip-path="url(#{clip_id})">'
-                    + f'<use href="#{image_id}"{opacity_attr} '
-                    + f'transform="{transform_attr}"/></g>'
+                    f'<use href="#{image_id}"{opacity_attr} '
+                    f'transform="{transform_attr}"/></g>'
                 )
 
     return PathShading(defs_body=defs_body, body=body)
@@ -8,9 +8,11 @@ from __future__ import annotations
 
 import re
 from abc import ABC
-from collections.abc import Iterable
-from decimal import Decimal
-from typing import Final, Self, TypedDict, final, override
+from collections.abc import Callable, Iterable
+from decimal import Decimal, getcontext
+from functools import lru_cache
+from itertools import islice
+from typing import ClassVar, Final, Self, final, override
 
 from .geometry import Line, ParametricEllipticalArc, Point, Vec2
 from .math import Number, Precision, as_bool, dec_to_rat, evalf, is_zero, rat_to_dec
@@ -35,11 +37,11 @@ __all__ = [
     "SvgPath",
 ]
 
-_number_strip_trailing_zeros: Final = re.compile(r"^(-?[0-9]*\.([0-9]*[1-9])?)0*$")
-_number_strip_dot: Final = re.compile(r"\.$")
-_number_leading_zero: Final = re.compile(r"^(-?)0\.")
-_minify_cmd_space: Final = re.compile(r"^([a-zA-Z]) ")
-_minify_dot_gap: Final = re.compile(r"(\.[0-9]+) (?=\.)")
+# Spaces around commands, before minus signs, and between numbers with fractions.
+_minify_space: Final = re.compile(r" ?([a-zA-Z]) ?| (?=-)|(\.[0-9]+) (?=\.)")
+
+# Shared origin for points that are only read, to avoid allocating it repeatedly.
+_origin: Final = Point(0, 0)
 
 
 def _dec_to_str(x: Decimal) -> str:
@@ -52,24 +54,96 @@ def _dec_to_str(x: Decimal) -> str:
     return f"{x.normalize():f}"
 
 
+@lru_cache(maxsize=64)
+def _cos_sin_cached(degrees: Decimal, prec: int) -> tuple[Decimal, Decimal]:
+    """Implementation of :func:`_cos_sin` for a given precision ``prec``."""
+    import sympy as sp
+
+    angle = sp.rad(dec_to_rat(degrees))
+    return rat_to_dec(sp.cos(angle)), rat_to_dec(sp.sin(angle))
+
+
+# Exact cosine and sine of quarter turns, keyed by the remainder modulo 360.
+# The remainder has the sign of the angle, hence the negative keys.
+_quarter_turns: Final[dict[int, tuple[Decimal, Decimal]]] = {
+    0: (Decimal(1), Decimal(0)),
+    90: (Decimal(0), Decimal(1)),
+    180: (Decimal(-1), Decimal(0)),
+    270: (Decimal(0), Decimal(-1)),
+    -90: (Decimal(0), Decimal(-1)),
+    -180: (Decimal(-1), Decimal(0)),
+    -270: (Decimal(0), Decimal(1)),
+}
+
+
+def _cos_sin(degrees: Decimal) -> tuple[Decimal, Decimal]:
+    """
+    Return cosine and sine of an angle in degrees at the current precision.
+
+    Quarter turns are looked up directly. Otherwise, the symbolic evaluation is
+    expensive, so results are cached per angle and precision, as all items of a
+    path are rotated by the same angle.
+    """
+    exact = _quarter_turns.get(degrees % 360)
+    if exact is not None:
+        return exact
+    return _cos_sin_cached(degrees, getcontext().prec)
+
+
+@lru_cache(maxsize=16384)
+def _format_decimal_cached(
+    v: Decimal, signed: bool, d: int | None, minify: bool, prec: int, rounding: str
+) -> str:
+    """Implementation of :func:`format_decimal` for the given context parameters."""
+    v = v.normalize()
+    # A normalized value has no trailing zeros in its fractional part.
+    s = f"{v:f}" if d is None else f"{v:.{d}f}"
+    if d and "." in s:
+        s = s.rstrip("0").rstrip(".")
+    if minify:
+        if s.startswith("0."):
+            s = s[1:]
+        elif s.startswith("-0."):
+            s = "-" + s[2:]
+    return s
+
+
 def format_decimal(v: Decimal, *, d: int | None = None, minify: bool = False) -> str:
     """
     Format a ``Decimal`` with optional fixed decimals and SVG number minification.
 
+    Coordinates repeat a lot within paths, so results are cached.
+
     :param v: Value to format.
     :param d: Number of decimal places, or ``None`` for default string conversion.
     :param minify: Apply SVG-oriented minification (strip trailing zeros,
         leading zero before decimal, etc.).
     """
-    v = v.normalize()
-    s = f"{v:.{d}f}" if d is not None else f"{v:f}"
-    s = _number_strip_trailing_zeros.sub(r"\1", s)
-    s = _number_strip_dot.sub("", s)
-    if minify:
-        s = _number_leading_zero.sub(r"\1.", s)
-    return s
+    # Equal values are formatted identically, except for the sign of zero.
+    # Normalization depends on the context, so it is part of the cache key.
+    ctx = getcontext()
+    return _format_decimal_cached(v, v.is_signed(), d, minify, ctx.prec, ctx.rounding)
+
+
+def _group_type(t: str) -> str:
+    """
+    Return the command type of the minified group started by a command of type ``t``.
+
+    Implicit commands after ``M``/``m`` are ``L``/``l``, so such groups accept those.
+    """
+    return "l" if t == "m" else ("L" if t == "M" else t)
 
 
+def _minify_group(s: str) -> str:
+    """
+    Strip whitespace that is not needed from serialized command groups.
+
+    ``s`` can contain a single group or several groups separated by spaces.
+    """
+    return _minify_space.sub(r"\1\2", s)
+
+
+@lru_cache(maxsize=64)
 def _parse_format_spec(spec: str) -> tuple[int | None, bool]:
     """
     Parse a format specification for path/string formatting.
@@ -110,44 +184,74 @@ class SvgPoint(Point):
     Instances hold a back-reference to the :class:`SvgItem` that owns them.
     """
 
+    __slots__ = ("item_reference",)
+
     def __init__(self, x: Number, y: Number) -> None:
         """
         :param x: x coordinate.
         :param y: y coordinate.
         """
         super().__init__(x, y)
-        self.item_reference: SvgItem = DummySvgItem()
+        self.item_reference: SvgItem = _unowned
 
 
 class SvgControlPoint(SvgPoint):
     """
     Control point for Bézier segments with optional relation hints.
 
-    The :attr:`relations` list can be used to store points that geometrically
+    The :attr:`relations` tuple can be used to store points that geometrically
     constrain this control point (e.g. endpoints of the segment).
     """
 
-    def __init__(self, point: Point, relations: list[Point]) -> None:
+    __slots__ = ("sub_index", "relations")
+
+    def __init__(
+        self, point: Point, relations: Iterable[Point] = (), sub_index: int = 0
+    ) -> None:
         """
         :param point: Base point for the control point.
         :param relations: Related points, e.g. endpoints of the curve segment.
+        :param sub_index: Index of this control point within its item.
         """
         super().__init__(point.x, point.y)
-        self.sub_index: int = 0
-        self.relations: list[Point] = relations
+        self.sub_index: int = sub_index
+        self.relations: tuple[Point, ...] = tuple(relations)
 
 
 class SvgItem(ABC):
     """Base class for a single SVG path command and its numeric values."""
 
+    __slots__ = (
+        "_relative",
+        "values",
+        "previous_point",
+        "absolute_points",
+        "absolute_control_points",
+    )
+
+    # Uppercase command letter, defined by each concrete subclass.
+    key: ClassVar[str]
+    # Lowercase command letter, derived from ``key`` when the subclass is created.
+    relative_key: ClassVar[str]
+    # Whether this command sets the origin of the following subpath.
+    updates_origin: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Derive :attr:`relative_key` for subclasses that define :attr:`key`."""
+        super().__init_subclass__(**kwargs)
+        if "key" in cls.__dict__:
+            cls.relative_key = cls.key.lower()
+
     def __init__[T: Number](self, values: list[T], relative: bool) -> None:
         """
         :param values: Command parameters as a flat list of numbers.
         :param relative: Whether values are stored in relative coordinates.
         """
         self._relative: bool = relative
-        self.values: list[Decimal] = [Decimal(v) for v in values]
-        self.previous_point: Point = Point(0, 0)
+        self.values: list[Decimal] = [
+            v if type(v) is Decimal else Decimal(v) for v in values
+        ]
+        self.previous_point: Point = _origin
         self.absolute_points: list[SvgPoint] = []
         self.absolute_control_points: list[SvgControlPoint] = []
 
@@ -165,26 +269,11 @@ class SvgItem(ABC):
             raise ValueError("Empty SVG item")
 
         cmd = raw_item[0]
-        relative = cmd.islower()
-        values = [Decimal(it) for it in raw_item[1:]]
-
-        mapping: dict[str, type[SvgItem]] = {
-            MoveTo.key: MoveTo,
-            LineTo.key: LineTo,
-            HorizontalLineTo.key: HorizontalLineTo,
-            VerticalLineTo.key: VerticalLineTo,
-            ClosePath.key: ClosePath,
-            CurveTo.key: CurveTo,
-            SmoothCurveTo.key: SmoothCurveTo,
-            QuadraticBezierCurveTo.key: QuadraticBezierCurveTo,
-            SmoothQuadraticBezierCurveTo.key: SmoothQuadraticBezierCurveTo,
-            EllipticalArcTo.key: EllipticalArcTo,
-        }
-
-        cls = mapping.get(cmd.upper())
+        key = cmd.upper()
+        cls = _item_types.get(key)
         if not cls:
             raise ValueError(f"Invalid SVG command type: {cmd!r}")
-        return cls(values, relative)
+        return cls([Decimal(it) for it in raw_item[1:]], cmd != key)
 
     @staticmethod
     def make_from(origin: SvgItem, previous: SvgItem, new_type: str) -> SvgItem:
@@ -263,15 +352,14 @@ class SvgItem(ABC):
         :param origin: Current subpath origin (last ``M``/``m`` or ``Z``).
         :param previous: Previous item in the path, or ``None`` for the first item.
         """
-        self.previous_point = previous.target_location if previous else Point(0, 0)
-        self.absolute_points = []
+        self.previous_point = previous.target_location if previous else _origin
 
-        current = self.previous_point if self.relative else Point(0, 0)
+        current = self.previous_point if self.relative else _origin
+        cx, cy, values = current.x, current.y, self.values
 
-        for i in range(0, len(self.values) - 1, 2):
-            self.absolute_points.append(
-                SvgPoint(current.x + self.values[i], current.y + self.values[i + 1])
-            )
+        self.absolute_points = [
+            SvgPoint(cx + x, cy + y) for x, y in zip(values[::2], values[1::2])
+        ]
 
     @property
     def relative(self) -> bool:
@@ -344,7 +432,8 @@ class SvgItem(ABC):
         as is done in :meth:`SvgPath.clone`.
         """
         clone = self.__class__(self.values.copy(), self._relative)
-        clone.previous_point = Point(self.previous_point.x, self.previous_point.y)
+        # Points are never modified in place, so the previous point can be shared.
+        clone.previous_point = self.previous_point
         return clone
 
     def translate(self, x: Number, y: Number, force: bool = False) -> None:
@@ -360,8 +449,9 @@ class SvgItem(ABC):
         """
         x, y = Decimal(x), Decimal(y)
         if not self.relative or force:
-            for idx in range(len(self.values)):
-                self.values[idx] += x if idx % 2 == 0 else y
+            values = self.values
+            values[0::2] = [v + x for v in values[0::2]]
+            values[1::2] = [v + y for v in values[1::2]]
 
     def translated(self, x: Number, y: Number, force: bool = False) -> SvgItem:
         """
@@ -383,8 +473,9 @@ class SvgItem(ABC):
         :param ky: Scale factor for y coordinates.
         """
         kx, ky = Decimal(kx), Decimal(ky)
-        for idx in range(len(self.values)):
-            self.values[idx] *= kx if idx % 2 == 0 else ky
+        values = self.values
+        values[0::2] = [v * kx for v in values[0::2]]
+        values[1::2] = [v * ky for v in values[1::2]]
 
     def scaled(self, kx: Number, ky: Number) -> SvgItem:
         """
@@ -411,20 +502,16 @@ class SvgItem(ABC):
         :param degrees: Rotation angle in degrees.
         :param force: Rotate relative coordinates around ``(ox, oy)``.
         """
-        import sympy as sp
-
         ox, oy, degrees = Decimal(ox), Decimal(oy), Decimal(degrees)
-        angle = sp.rad(dec_to_rat(degrees))
-        cosv, sinv = rat_to_dec(sp.cos(angle)), rat_to_dec(sp.sin(angle))
-
-        for i in range(0, len(self.values), 2):
-            px, py = self.values[i], self.values[i + 1]
-            cx, cy = (0, 0) if self._relative and not force else (ox, oy)
-            dx, dy = px - cx, py - cy
-            qx = cx + dx * cosv - dy * sinv
-            qy = cy + dx * sinv + dy * cosv
-            self.values[i] = qx
-            self.values[i + 1] = qy
+        cosv, sinv = _cos_sin(degrees)
+
+        # The rotation center is the same for all coordinate pairs.
+        cx, cy = (0, 0) if self._relative and not force else (ox, oy)
+        values = self.values
+        for i in range(0, len(values), 2):
+            dx, dy = values[i] - cx, values[i + 1] - cy
+            values[i] = cx + dx * cosv - dy * sinv
+            values[i + 1] = cy + dx * sinv + dy * cosv
 
     def rotated(
         self, ox: Number, oy: Number, degrees: Number, force: bool = False
@@ -483,11 +570,9 @@ class SvgItem(ABC):
         :param ignore_is_relative:
             Always return the uppercase key regardless of :attr:`relative`.
         """
-        type_key = getattr(self.__class__, "key")
-        assert isinstance(type_key, str)
-        if self.relative and not ignore_is_relative:
-            return type_key.lower()
-        return type_key
+        if self._relative and not ignore_is_relative:
+            return self.relative_key
+        return self.key
 
     def as_standalone_string(self) -> str:
         """
@@ -523,9 +608,32 @@ class SvgItem(ABC):
         :param trailing_items: Additional items of the same type to serialize
             in the same command group.
         """
-        flattened = self.values + [v for it in trailing_items for v in it.values]
-        str_values = [format_decimal(it, d=decimals, minify=minify) for it in flattened]
-        return " ".join([self.get_type(), *str_values])
+        out: list[str] = []
+        self.as_string_into(out, decimals, minify, trailing_items)
+        return " ".join(out)
+
+    def as_string_into(
+        self,
+        out: list[str],
+        decimals: int | None = None,
+        minify: bool = False,
+        trailing_items: Iterable["SvgItem"] = (),
+    ) -> None:
+        """
+        Append the space-separated parts of :meth:`as_string` to ``out``.
+
+        This allows serializing many commands into a single buffer.
+
+        :param out: List to append the command letter and values to.
+        :param decimals: Number of decimal places, or ``None`` for default.
+        :param minify: Use a more compact numeric representation.
+        :param trailing_items: Additional items of the same type to serialize
+            in the same command group.
+        """
+        out.append(self.get_type())
+        out.extend(format_decimal(v, d=decimals, minify=minify) for v in self.values)
+        for it in trailing_items:
+            out.extend(format_decimal(v, d=decimals, minify=minify) for v in it.values)
 
     @override
     def __format__(self, format_spec: str) -> str:
@@ -557,16 +665,25 @@ class SvgItem(ABC):
 class DummySvgItem(SvgItem):
     """Placeholder item used as a default reference owner for points."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Create a dummy item with no values, always absolute."""
         super().__init__([], False)
 
 
+# Shared owner of points that are not bound to an item yet. Points are created far
+# more often than they stay unbound, as refreshing an item binds its new points.
+_unowned: Final = DummySvgItem()
+
+
 @final
 class MoveTo(SvgItem):
     """SVG ``M``/``m`` command (move current point)."""
 
+    __slots__ = ()
     key = "M"
+    updates_origin = True
 
 
 def M(x: Number, y: Number) -> MoveTo:
@@ -581,6 +698,7 @@ def m(x: Number, y: Number) -> MoveTo:
 class LineTo(SvgItem):
     """SVG ``L``/``l`` command (line to point)."""
 
+    __slots__ = ()
     key = "L"
 
 
@@ -596,6 +714,7 @@ def l(x: Number, y: Number) -> LineTo:
 class CurveTo(SvgItem):
     """SVG ``C``/``c`` command (cubic Bézier curve)."""
 
+    __slots__ = ()
     key = "C"
 
     @override
@@ -612,8 +731,10 @@ class CurveTo(SvgItem):
         if not previous_target:
             raise ValueError("Invalid path: CurveTo without previous item")
         self.absolute_control_points = [
-            SvgControlPoint(self.absolute_points[0], [previous_target.target_location]),
-            SvgControlPoint(self.absolute_points[1], [self.target_location]),
+            SvgControlPoint(
+                self.absolute_points[0], (previous_target.target_location,)
+            ),
+            SvgControlPoint(self.absolute_points[1], (self.target_location,), 1),
         ]
 
     @override
@@ -624,17 +745,20 @@ class CurveTo(SvgItem):
         :param previous_target: Previous item in the path.
         """
         a, b = previous_target.target_location, self.target_location
-        d = a if self.relative else Point(0, 0)
-        self.values[0] = 2 * a.x / 3 + b.x / 3 - d.x
-        self.values[1] = 2 * a.y / 3 + b.y / 3 - d.y
-        self.values[2] = a.x / 3 + 2 * b.x / 3 - d.x
-        self.values[3] = a.y / 3 + 2 * b.y / 3 - d.y
+        d = a if self._relative else _origin
+        ax, ay, bx, by, dx, dy = a.x, a.y, b.x, b.y, d.x, d.y
+        values = self.values
+        values[0] = 2 * ax / 3 + bx / 3 - dx
+        values[1] = 2 * ay / 3 + by / 3 - dy
+        values[2] = ax / 3 + 2 * bx / 3 - dx
+        values[3] = ay / 3 + 2 * by / 3 - dy
 
 
 @final
 class SmoothCurveTo(SvgItem):
     """SVG ``S``/``s`` command (smooth cubic Bézier curve)."""
 
+    __slots__ = ()
     key = "S"
 
     @override
@@ -647,43 +771,28 @@ class SmoothCurveTo(SvgItem):
         :param origin: Current subpath origin.
         :param previous_target: Previous item in the path, used for reflection.
         """
-        self.absolute_control_points = []
-
         if isinstance(previous_target, (CurveTo, SmoothCurveTo)):
             prev_loc = previous_target.target_location
             prev_control = previous_target.absolute_control_points[1]
             pt = Point(2 * prev_loc.x - prev_control.x, 2 * prev_loc.y - prev_control.y)
-            self.absolute_control_points.append(SvgControlPoint(pt, [prev_loc]))
+            first = SvgControlPoint(pt, (prev_loc,))
         else:
-            current = (
-                previous_target.target_location if previous_target else Point(0, 0)
-            )
-            pt = Point(current.x, current.y)
-            self.absolute_control_points.append(SvgControlPoint(pt, []))
-
-        self.absolute_control_points.append(
-            SvgControlPoint(self.absolute_points[0], [self.target_location])
-        )
+            # The control point copies the coordinates of the current point.
+            current = previous_target.target_location if previous_target else _origin
+            first = SvgControlPoint(current)
+
+        self.absolute_control_points = [
+            first,
+            SvgControlPoint(self.absolute_points[0], (self.target_location,), 1),
+        ]
 
     @override
     def as_standalone_string(self) -> str:
         """Standalone SVG path fragment using ``M`` and an explicit ``C``."""
         ctrl0, ctrl1 = self.absolute_control_points
-        target = self.absolute_points[1]
-        return " ".join(
-            [
-                "M",
-                _dec_to_str(self.previous_point.x),
-                _dec_to_str(self.previous_point.y),
-                "C",
-                _dec_to_str(ctrl0.x),
-                _dec_to_str(ctrl0.y),
-                _dec_to_str(ctrl1.x),
-                _dec_to_str(ctrl1.y),
-                _dec_to_str(target.x),
-                _dec_to_str(target.y),
-            ]
-        )
+        points = (self.previous_point, ctrl0, ctrl1, self.absolute_points[1])
+        f = [_dec_to_str(v) for pt in points for v in (pt.x, pt.y)]
+        return f"M {f[0]} {f[1]} C {f[2]} {f[3]} {f[4]} {f[5]} {f[6]} {f[7]}"
 
     @override
     def reset_control_points(self, previous_target: SvgItem) -> None:
@@ -693,7 +802,7 @@ class SmoothCurveTo(SvgItem):
         :param previous_target: Previous item in the path.
         """
         a, b = previous_target.target_location, self.target_location
-        d = a if self.relative else Point(0, 0)
+        d = a if self.relative else _origin
         self.values[0] = a.x / 3 + 2 * b.x / 3 - d.x
         self.values[1] = a.y / 3 + 2 * b.y / 3 - d.y
 
@@ -716,6 +825,7 @@ class SmoothCurveTo(SvgItem):
 class QuadraticBezierCurveTo(SvgItem):
     """SVG ``Q``/``q`` command (quadratic Bézier curve)."""
 
+    __slots__ = ()
     key = "Q"
 
     @override
@@ -733,7 +843,7 @@ class QuadraticBezierCurveTo(SvgItem):
             raise ValueError("Invalid path: QuadraticBezierCurveTo without previous")
         ctrl = SvgControlPoint(
             self.absolute_points[0],
-            [previous_target.target_location, self.target_location],
+            (previous_target.target_location, self.target_location),
         )
         self.absolute_control_points = [ctrl]
 
@@ -745,7 +855,7 @@ class QuadraticBezierCurveTo(SvgItem):
         :param previous_target: Previous item in the path.
         """
         a, b = previous_target.target_location, self.target_location
-        d = a if self.relative else Point(0, 0)
+        d = a if self.relative else _origin
         self.values[0] = (a.x + b.x) / 2 - d.x
         self.values[1] = (a.y + b.y) / 2 - d.y
 
@@ -754,6 +864,7 @@ class QuadraticBezierCurveTo(SvgItem):
 class SmoothQuadraticBezierCurveTo(SvgItem):
     """SVG ``T``/``t`` command (smooth quadratic Bézier curve)."""
 
+    __slots__ = ()
     key = "T"
 
     @override
@@ -769,43 +880,36 @@ class SmoothQuadraticBezierCurveTo(SvgItem):
         if not isinstance(
             previous_target, (QuadraticBezierCurveTo, SmoothQuadraticBezierCurveTo)
         ):
-            previous = (
-                previous_target.target_location if previous_target else Point(0, 0)
-            )
-            pt = Point(previous.x, previous.y)
-            self.absolute_control_points = [SvgControlPoint(pt, [])]
+            # The control point copies the coordinates of the previous point.
+            previous = previous_target.target_location if previous_target else _origin
+            self.absolute_control_points = [SvgControlPoint(previous)]
             return
 
         prev_loc = previous_target.target_location
         prev_control = previous_target.absolute_control_points[0]
         pt = Point(2 * prev_loc.x - prev_control.x, 2 * prev_loc.y - prev_control.y)
-        ctrl = SvgControlPoint(pt, [prev_loc, self.target_location])
+        ctrl = SvgControlPoint(pt, (prev_loc, self.target_location))
         self.absolute_control_points = [ctrl]
 
     @override
     def as_standalone_string(self) -> str:
         """Standalone SVG path fragment using ``M`` and an explicit ``Q``."""
-        ctrl = self.absolute_control_points[0]
-        target = self.absolute_points[0]
-        return " ".join(
-            [
-                "M",
-                _dec_to_str(self.previous_point.x),
-                _dec_to_str(self.previous_point.y),
-                "Q",
-                _dec_to_str(ctrl.x),
-                _dec_to_str(ctrl.y),
-                _dec_to_str(target.x),
-                _dec_to_str(target.y),
-            ]
+        points = (
+            self.previous_point,
+            self.absolute_control_points[0],
+            self.absolute_points[0],
         )
+        f = [_dec_to_str(v) for pt in points for v in (pt.x, pt.y)]
+        return f"M {f[0]} {f[1]} Q {f[2]} {f[3]} {f[4]} {f[5]}"
 
 
 @final
 class ClosePath(SvgItem):
     """SVG ``Z``/``z`` command (close current subpath)."""
 
+    __slots__ = ()
     key = "Z"
+    updates_origin = True
 
     @override
     def refresh_absolute_points(self, origin: Point, previous: SvgItem | None) -> None:
@@ -815,7 +919,7 @@ class ClosePath(SvgItem):
         :param origin: Subpath origin point.
         :param previous: Previous item in the path, if any.
         """
-        self.previous_point = previous.target_location if previous else Point(0, 0)
+        self.previous_point = previous.target_location if previous else _origin
         self.absolute_points = [SvgPoint(origin.x, origin.y)]
 
 
@@ -831,6 +935,7 @@ def z() -> ClosePath:
 class HorizontalLineTo(SvgItem):
     """SVG ``H``/``h`` command (horizontal line)."""
 
+    __slots__ = ()
     key = "H"
 
     @override
@@ -848,7 +953,7 @@ class HorizontalLineTo(SvgItem):
         :param degrees: Rotation angle in degrees.
         :param force: Unused for this subclass.
         """
-        if Decimal(degrees) == Decimal(180):
+        if Decimal(degrees) == 180:
             self.values[0] = -self.values[0]
 
     @override
@@ -859,9 +964,9 @@ class HorizontalLineTo(SvgItem):
         :param origin: Current subpath origin.
         :param previous: Previous item in the path.
         """
-        self.previous_point = previous.target_location if previous else Point(0, 0)
-        x = self.values[0] + self.previous_point.x if self.relative else self.values[0]
-        self.absolute_points = [SvgPoint(x, self.previous_point.y)]
+        prev = self.previous_point = previous.target_location if previous else _origin
+        x = self.values[0] + prev.x if self._relative else self.values[0]
+        self.absolute_points = [SvgPoint(x, prev.y)]
 
     @override
     def set_target_location(self, pt: Point) -> None:
@@ -879,6 +984,7 @@ class HorizontalLineTo(SvgItem):
 class VerticalLineTo(SvgItem):
     """SVG ``V``/``v`` command (vertical line)."""
 
+    __slots__ = ()
     key = "V"
 
     @override
@@ -896,7 +1002,7 @@ class VerticalLineTo(SvgItem):
         :param degrees: Rotation angle in degrees.
         :param force: Unused for this subclass.
         """
-        if Decimal(degrees) == Decimal(180):
+        if Decimal(degrees) == 180:
             self.values[0] = -self.values[0]
 
     @override
@@ -933,9 +1039,9 @@ class VerticalLineTo(SvgItem):
         :param origin: Current subpath origin.
         :param previous: Previous item in the path.
         """
-        self.previous_point = previous.target_location if previous else Point(0, 0)
-        y = self.values[0] + self.previous_point.y if self.relative else self.values[0]
-        self.absolute_points = [SvgPoint(self.previous_point.x, y)]
+        prev = self.previous_point = previous.target_location if previous else _origin
+        y = self.values[0] + prev.y if self._relative else self.values[0]
+        self.absolute_points = [SvgPoint(prev.x, y)]
 
     @override
     def set_target_location(self, pt: Point) -> None:
@@ -952,6 +1058,7 @@ class VerticalLineTo(SvgItem):
 class EllipticalArcTo(SvgItem):
     """SVG ``A``/``a`` command (elliptical arc)."""
 
+    __slots__ = ()
     key = "A"
 
     @override
@@ -983,13 +1090,10 @@ class EllipticalArcTo(SvgItem):
         :param degrees: Rotation angle in degrees.
         :param force: Rotate relative coordinates around ``(ox, oy)``.
         """
-        import sympy as sp
-
         ox, oy, degrees = Decimal(ox), Decimal(oy), Decimal(degrees)
 
         self.values[2] = (self.values[2] + degrees) % 360
-        angle = sp.rad(dec_to_rat(degrees))
-        cosv, sinv = rat_to_dec(sp.cos(angle)), rat_to_dec(sp.sin(angle))
+        cosv, sinv = _cos_sin(degrees)
         px, py = self.values[5], self.values[6]
         x, y = (0, 0) if self.relative and not force else (ox, oy)
         dx, dy = px - x, py - y
@@ -1164,7 +1268,7 @@ class EllipticalArcTo(SvgItem):
         :param origin: Current subpath origin.
         :param previous: Previous item in the path.
         """
-        self.previous_point = previous.target_location if previous else Point(0, 0)
+        self.previous_point = previous.target_location if previous else _origin
         if self.relative:
             x = self.values[5] + self.previous_point.x
             y = self.values[6] + self.previous_point.y
@@ -1173,31 +1277,30 @@ class EllipticalArcTo(SvgItem):
             self.absolute_points = [SvgPoint(self.values[5], self.values[6])]
 
     @override
-    def as_string(
+    def as_string_into(
         self,
+        out: list[str],
         decimals: int | None = None,
         minify: bool = False,
         trailing_items: Iterable[SvgItem] = (),
-    ) -> str:
+    ) -> None:
         """
-        Serialize this arc (and optionally trailing arcs) to an SVG path fragment.
+        Serialize this arc (and optionally trailing arcs) into ``out``.
 
+        :param out: List to append the command letter and values to.
         :param decimals: Number of decimal places, or ``None`` for default.
         :param minify: Use a compact group representation.
         :param trailing_items: Additional arc items to serialize together.
         """
         if not minify:
-            return super().as_string(decimals, minify, trailing_items)
+            super().as_string_into(out, decimals, minify, trailing_items)
+            return
 
-        vals_groups = [self.values, *[it.values for it in trailing_items]]
-        formatted_groups = [
-            [format_decimal(v, d=decimals, minify=minify) for v in vals]
-            for vals in vals_groups
-        ]
-        compact = [
-            f"{v[0]} {v[1]} {v[2]} {v[3]}{v[4]}{v[5]} {v[6]}" for v in formatted_groups
-        ]
-        return " ".join([self.get_type(), *compact])
+        out.append(self.get_type())
+        for it in (self, *trailing_items):
+            # Formatted numbers are cached, so repeated radii and angles are cheap.
+            f = [format_decimal(v, d=decimals, minify=True) for v in it.values]
+            out.append(f"{f[0]} {f[1]} {f[2]} {f[3]}{f[4]}{f[5]} {f[6]}")
 
 
 def A(
@@ -1230,12 +1333,43 @@ def a(
     )
 
 
-class _Grouped(TypedDict):
-    """Internal helper structure for grouping path items by command type."""
+_item_types: Final[dict[str, type[SvgItem]]] = {
+    MoveTo.key: MoveTo,
+    LineTo.key: LineTo,
+    HorizontalLineTo.key: HorizontalLineTo,
+    VerticalLineTo.key: VerticalLineTo,
+    ClosePath.key: ClosePath,
+    CurveTo.key: CurveTo,
+    SmoothCurveTo.key: SmoothCurveTo,
+    QuadraticBezierCurveTo.key: QuadraticBezierCurveTo,
+    SmoothQuadraticBezierCurveTo.key: SmoothQuadraticBezierCurveTo,
+    EllipticalArcTo.key: EllipticalArcTo,
+}
+"""Item classes by their (uppercase) command letter, used by :meth:`SvgItem.make`."""
+
+
+@lru_cache(maxsize=256)
+def _parse_path(path: str) -> tuple[SvgItem, ...]:
+    """
+    Parse an SVG path data string into template items.
+
+    The same path strings tend to be parsed repeatedly, so results are cached.
+    The returned items are shared between all callers and must only be cloned.
+    """
+    return tuple(SvgItem.make(it) for it in PathParser.parse(path))
+
+
+def _move_point(pt_reference: SvgPoint, to: Point) -> None:
+    """
+    Move a target or control point of its item to ``to`` without any refresh.
 
-    type: str
-    item: SvgItem
-    trailing: list[SvgItem]
+    :param pt_reference: Point (target or control) to be moved.
+    :param to: New absolute location for the point.
+    """
+    if isinstance(pt_reference, SvgControlPoint):
+        pt_reference.item_reference.set_control_location(pt_reference.sub_index, to)
+    else:
+        pt_reference.item_reference.set_target_location(to)
 
 
 class SvgPath:
@@ -1247,8 +1381,7 @@ class SvgPath:
             of :class:`SvgItem` instances.
         """
         if isinstance(path, str):
-            raw_path = PathParser.parse(path)
-            self.path: list[SvgItem] = [SvgItem.make(it) for it in raw_path]
+            self.path: list[SvgItem] = [it.clone() for it in _parse_path(path)]
         else:
             self.path = path
         self.refresh_absolute_positions()
@@ -1271,9 +1404,13 @@ class SvgPath:
         :param dx: Translation in x direction.
         :param dy: Translation in y direction.
         """
-        for idx, it in enumerate(self.path):
-            it.translate(dx, dy, idx == 0)
-        self.refresh_absolute_positions()
+        # Convert once instead of per item, as inputs may be strings to be parsed.
+        dx, dy = Decimal(dx), Decimal(dy)
+
+        # Translation only depends on the values of the item itself, so each item
+        # is refreshed right away, without a second pass over the path. Translating
+        # by zero is not skipped, as it still normalizes negative zeros.
+        self._update_items(lambda idx, it: it.translate(dx, dy, idx == 0))
 
     def translated(self, dx: Number, dy: Number) -> SvgPath:
         """
@@ -1293,9 +1430,11 @@ class SvgPath:
         :param kx: Scale factor for x coordinates.
         :param ky: Scale factor for y coordinates.
         """
-        for it in self.path:
-            it.scale(kx, ky)
-        self.refresh_absolute_positions()
+        kx, ky = Decimal(kx), Decimal(ky)
+
+        # As for translation, each item is refreshed right after being scaled.
+        # Scaling by one is not skipped, as it still rounds to the context precision.
+        self._update_items(lambda _, it: it.scale(kx, ky))
 
     def scaled(self, kx: Number, ky: Number) -> SvgPath:
         """
@@ -1319,14 +1458,18 @@ class SvgPath:
         :param degrees: Rotation angle in degrees.
         """
         degrees = Decimal(degrees) % 360
-        if degrees == Decimal(0):
+        if degrees == 0:
             return
 
+        # Convert once so that the items reuse the same values (and the cached
+        # cosine and sine of the angle) instead of converting them again.
+        ox, oy = Decimal(ox), Decimal(oy)
+        # Only half turns map horizontal and vertical lines to themselves.
+        half_turn = degrees == 180
+        quarter_turn = degrees in (90, 270)
         for idx, it in enumerate(self.path):
             last_instance_of = type(it)
-            if degrees != Decimal(180) and isinstance(
-                it, (HorizontalLineTo, VerticalLineTo)
-            ):
+            if not half_turn and last_instance_of in (HorizontalLineTo, VerticalLineTo):
                 new_type = LineTo.key.lower() if it.relative else LineTo.key
                 changed = self.change_type(idx, new_type)
                 if changed is not None:
@@ -1334,7 +1477,7 @@ class SvgPath:
 
             it.rotate(ox, oy, degrees, idx == 0)
 
-            if degrees in (Decimal(90), Decimal(270)):
+            if quarter_turn:
                 if last_instance_of is HorizontalLineTo:
                     self.refresh_absolute_positions()
                     new_type = (
@@ -1382,9 +1525,13 @@ class SvgPath:
 
         :param new_relative: Target representation (``True`` for relative).
         """
-        for it in self.path:
+
+        def convert(_: int, it: SvgItem) -> None:
             it.relative = new_relative
-        self.refresh_absolute_positions()
+
+        # The conversion uses the previous point from the last refresh, which the
+        # refresh of the item itself only updates afterwards.
+        self._update_items(convert)
 
     def with_relative(self, new_relative: bool) -> SvgPath:
         """
@@ -1439,25 +1586,29 @@ class SvgPath:
         :param decimals: Number of decimal places, or ``None`` for default.
         :param minify: Use a compact representation.
         """
-        grouped: list[_Grouped] = []
+        if not minify:
+            out: list[str] = []
+            for it in self.path:
+                it.as_string_into(out, decimals)
+            return " ".join(out)
+
+        # Group items by command type and serialize each group into one buffer as
+        # soon as it ends. The joined string is minified at once.
+        out = []
+        group: SvgItem | None = None
+        group_type = ""
+        trailing: list[SvgItem] = []
         for it in self.path:
             t = it.get_type()
-            if minify and grouped and (last := grouped[-1])["type"] == t:
-                last["trailing"].append(it)
+            if group is not None and t == group_type:
+                trailing.append(it)
                 continue
-            gtype = "l" if t == "m" else ("L" if t == "M" else t)
-            grouped.append({"type": gtype, "item": it, "trailing": []})
-
-        out_parts: list[str] = []
-        for g in grouped:
-            s = g["item"].as_string(decimals, minify, g["trailing"])
-            if minify:
-                s = _minify_cmd_space.sub(r"\1", s)
-                s = s.replace(" -", "-")
-                s = _minify_dot_gap.sub(r"\1", s)
-            out_parts.append(s)
-
-        return "".join(out_parts) if minify else " ".join(out_parts)
+            if group is not None:
+                group.as_string_into(out, decimals, True, trailing)
+            group, group_type, trailing = it, _group_type(t), []
+        if group is not None:
+            group.as_string_into(out, decimals, True, trailing)
+        return _minify_group(" ".join(out))
 
     @property
     def target_locations(self) -> list[SvgPoint]:
@@ -1467,13 +1618,8 @@ class SvgPath:
     @property
     def control_locations(self) -> list[SvgControlPoint]:
         """Flattened list of all absolute control points for the path."""
-        result: list[SvgControlPoint] = []
-        for item in self.path[1:]:
-            controls = item.control_locations
-            for idx, ctrl in enumerate(controls):
-                ctrl.sub_index = idx
-            result.extend(controls)
-        return result
+        # Skip the first item without copying the list.
+        return [c for it in islice(self.path, 1, None) for c in it.control_locations]
 
     def set_location(self, pt_reference: SvgPoint, to: Point) -> None:
         """
@@ -1485,12 +1631,37 @@ class SvgPath:
         :param pt_reference: Point (target or control) to be moved.
         :param to: New absolute location for the point.
         """
-        if isinstance(pt_reference, SvgControlPoint):
-            pt_reference.item_reference.set_control_location(pt_reference.sub_index, to)
-        else:
-            pt_reference.item_reference.set_target_location(to)
+        _move_point(pt_reference, to)
         self.refresh_absolute_positions()
 
+    def set_locations(self, edits: Iterable[tuple[SvgPoint, Point]]) -> None:
+        """
+        Move several points, refreshing the path in a single pass.
+
+        The result is the same as calling :meth:`set_location` for each edit in path
+        order, with edits of the same item applied in the given order.
+
+        :param edits: Pairs of point references and their new absolute locations.
+        :raises ValueError: If a point does not belong to an item of this path.
+        """
+        pending: dict[int, list[tuple[SvgPoint, Point]]] = {}
+        for pt_reference, to in edits:
+            key = id(pt_reference.item_reference)
+            pending.setdefault(key, []).append((pt_reference, to))
+        if not pending.keys() <= {id(it) for it in self.path}:
+            raise ValueError("Point does not belong to this path")
+
+        previous: SvgItem | None = None
+        origin: Point = _origin
+        for item in self.path:
+            item.refresh(origin, previous)
+            for pt_reference, to in pending.get(id(item), ()):
+                _move_point(pt_reference, to)
+                item.refresh(origin, previous)
+            if item.updates_origin:
+                origin = item.target_location
+            previous = item
+
     def refresh_absolute_positions(self) -> None:
         """
         Recompute absolute positions for all items in the path.
@@ -1498,10 +1669,28 @@ class SvgPath:
         This should be called after structural or coordinate changes.
         """
         previous: SvgItem | None = None
-        origin = Point(0, 0)
+        origin: Point = _origin
         for item in self.path:
             item.refresh(origin, previous)
-            if isinstance(item, (MoveTo, ClosePath)):
+            if item.updates_origin:
+                origin = item.target_location
+            previous = item
+
+    def _update_items(self, update: Callable[[int, SvgItem], None]) -> None:
+        """
+        Apply ``update`` to each item with its index and refresh the item right after.
+
+        This modifies and refreshes the items in a single pass, which is valid as long
+        as the modification of an item only depends on the items before it.
+
+        :param update: Function modifying an item in place.
+        """
+        previous: SvgItem | None = None
+        origin: Point = _origin
+        for idx, item in enumerate(self.path):
+            update(idx, item)
+            item.refresh(origin, previous)
+            if item.updates_origin:
                 origin = item.target_location
             previous = item
 
@@ -77,6 +77,11 @@ def test_vec2_eq() -> None:
     assert a != b
     assert not a == 1
 
+    # Symbolic coordinates are compared by SymPy.
+    c = b.normalized
+    assert c == a.normalized
+    assert c != a
+
 
 def test_vec2_normalize_zero() -> None:
     z = Point(0, 0).vec2
@@ -4,9 +4,17 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+from decimal import Decimal, localcontext
+
 import pytest
 
-from svg_path_editor.math import as_bool, polynomial_roots
+from svg_path_editor.math import (
+    as_bool,
+    canonical_decimal,
+    dec_to_rat,
+    polynomial_roots,
+    rat_to_dec,
+)
 
 
 def test_as_bool_invalid() -> None:
@@ -57,3 +65,17 @@ def test_quintic_roots() -> None:
 
     with pytest.raises(ValueError):
         polynomial_roots(x**5, x)
+
+
+def test_rational_decimal_round_trip() -> None:
+    import sympy as sp
+
+    for s in ["0", "-0", "1", "-2.5", "0.125", "1e-30", "123456789.000001"]:
+        d = Decimal(s)
+        assert dec_to_rat(d) == sp.Rational(s)
+        assert str(rat_to_dec(dec_to_rat(d))) == str(canonical_decimal(d))
+
+    # Inexact quotients are evaluated numerically at the current precision.
+    with localcontext(prec=5):
+        assert rat_to_dec(sp.Rational(1, 3)) == Decimal("0.33333")
+        assert rat_to_dec(sp.Rational(123456, 1)) == Decimal("1.2346E+5")
@@ -4,6 +4,8 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+from decimal import Decimal, localcontext
+
 import pytest
 
 from svg_path_editor import Point, SvgItem, SvgPath
@@ -14,6 +16,7 @@ from svg_path_editor.svg import (
     MoveTo,
     QuadraticBezierCurveTo,
     a,
+    format_decimal,
     l,
     m,
     z,
@@ -171,3 +174,83 @@ def test_scale_elliptical_arc_uniformly() -> None:
     """Scale an elliptical arc uniformly, which uses a special-cased implementation."""
     path = SvgPath("M 0 0 A 1 2 45 0 0 3 0")
     assert str(path.scaled(2, 2)) == str(SvgPath("M 0 0 A 2 4 45 0 0 6 0"))
+
+
+def test_format_decimal_context() -> None:
+    """Formatting respects the sign of zero and the current precision."""
+    assert format_decimal(Decimal("0")) == "0"
+    assert format_decimal(Decimal("-0")) == "-0"
+
+    value = Decimal("1.23456")
+    assert format_decimal(value) == "1.23456"
+    with localcontext(prec=3):
+        assert format_decimal(value) == "1.23"
+    assert format_decimal(value, minify=True) == "1.23456"
+
+
+def test_format_decimal_minify() -> None:
+    """Minification drops the leading zero of fractions of either sign."""
+    assert format_decimal(Decimal("0.5"), minify=True) == ".5"
+    assert format_decimal(Decimal("-0.5"), minify=True) == "-.5"
+    assert format_decimal(Decimal("-1.5"), minify=True) == "-1.5"
+    assert f"{SvgPath('M -0.5 -0.25 L 1 1'):m}" == "M-.5-.25 1 1"
+
+
+def test_path_parse_independent() -> None:
+    """Paths parsed from the same string do not share state."""
+    data = "M 0 0 L 1 2 A 1 1 0 0 1 3 3 Z"
+    first = SvgPath(data)
+    first.translate(1, 1)
+    first.path[1].values[0] = Decimal(5)
+
+    second = SvgPath(data)
+    assert str(second) == data
+    assert str(first) == "M 1 1 L 5 3 A 1 1 0 0 1 4 4 Z"
+
+
+def test_rotate_quarter_turns() -> None:
+    """Rotations by multiples of 90 degrees are exact for any sign and turn count."""
+    ante = SvgItem.make(["M", "2", "1"])
+
+    assert f"{ante.rotated(0, 0, 450)}" == "M -1 2"
+    assert f"{ante.rotated(0, 0, -90)}" == "M 1 -2"
+    assert f"{ante.rotated(0, 0, -180)}" == "M -2 -1"
+    assert f"{ante.rotated(0, 0, -270)}" == "M -1 2"
+    assert f"{ante.rotated(0, 0, 45):.4}" == "M 0.7071 2.1213"
+
+
+def test_control_point_sub_index() -> None:
+    """Control points carry their index within the item as soon as they are created."""
+    path = SvgPath("M 0 0 C 1 1 2 1 3 0 S 5 -1 6 0 Q 7 1 8 0 T 10 0")
+    assert [c.sub_index for it in path.path for c in it.control_locations] == [
+        0,
+        1,
+        0,
+        1,
+        0,
+        0,
+    ]
+
+
+def test_set_locations() -> None:
+    """Batched point moves match moving the points one by one in path order."""
+    data = "M 0 0 l 2 2 c 1 1 2 1 3 0 s 2 -1 3 0 q 1 1 2 0 t 2 0 h 1 v 1 z"
+    edits = [(1, Point(1, 3)), (3, Point(9, 1)), (5, Point(12, 1)), (6, Point(5, 5))]
+    ctrl_edits = [(1, Point(4, 4)), (2, Point(7, -2)), (4, Point(12, 3))]
+
+    sequential = SvgPath(data)
+    for i, to in edits:
+        sequential.set_location(sequential.target_locations[i], to)
+    for i, to in ctrl_edits:
+        sequential.set_location(sequential.control_locations[i], to)
+
+    batched = SvgPath(data)
+    targets, controls = batched.target_locations, batched.control_locations
+    batched.set_locations(
+        [(targets[i], to) for i, to in edits]
+        + [(controls[i], to) for i, to in ctrl_edits]
+    )
+    assert str(batched) == str(sequential)
+
+    with pytest.raises(ValueError):
+        batched.set_locations([(sequential.target_locations[1], Point(0, 0))])
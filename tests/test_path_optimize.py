@@ -4,7 +4,8 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-from svg_path_editor import SvgPath, optimize_path
+from svg_path_editor import SvgPath, optimize_path, simplify_arcs
+from svg_path_editor.path_operations import optimize_relative_absolute
 
 useless_moves_section = (
     "M 1 1 M 2 1 L 3 2 L 4 2 L 4 0 M 6 0 Z L 7 1 L 5 2 Z M 6 0 L 9 1"
@@ -96,6 +97,28 @@ def test_optimize_path_removes_useless_components() -> None:
     assert str(post_svg) == post
 
 
+def test_optimize_path_removes_components_at_path_start() -> None:
+    """Remove components next to the initial move without wrapping around."""
+    cases = [
+        ("M 0 0 L 0 0 L 1 0 L 1 1 Z", "M 0 0 L 1 0 L 1 1 Z"),
+        ("M 3 0 M -1 0.5 L 1 1", "M -1 0.5 L 1 1"),
+        ("M 1 1 L 2 2 M 3 3 Z L 4 4", "M 1 1 L 2 2 M 3 3 L 4 4"),
+        ("M 0 0 Z", ""),
+    ]
+
+    for ante, post in cases:
+        ante_svg = SvgPath(ante)
+        post_svg = optimize_path(
+            ante_svg,
+            remove_useless_commands=True,
+            remove_orphan_dots=True,
+        )
+
+        # Original must not be mutated
+        assert str(ante_svg) == ante
+        assert str(post_svg) == post
+
+
 def test_optimize_path_uses_shorthands() -> None:
     """Prefer shorthand ``C``/``S`` and ``Q``/``T`` commands."""
     post = (
@@ -158,6 +181,20 @@ def test_optimize_path_uses_relative_and_absolute() -> None:
     assert str(ante_svg) == test
     assert str(post_svg) == post
 
+    # The standalone pass yields the same result
+    post_svg = optimize_relative_absolute(ante_svg)
+
+    assert str(ante_svg) == test
+    assert str(post_svg) == post
+
+
+def test_optimize_relative_absolute_negative_zero() -> None:
+    """Rejected toggles that normalize negative zeros do not change later choices."""
+    ante = "M -1 -1 H -1 a 18 17 30 1 0 0.7477 14.16 z Q 0.8565 -1.634 -1 5 v -0 v -2"
+    post = "M -1 -1 h 0 a 18 17 30 1 0 0.7477 14.16 z Q 0.8565 -1.634 -1 5 v 0 V 3"
+
+    assert str(optimize_relative_absolute(SvgPath(ante))) == post
+
 
 def test_optimize_path_uses_reverse() -> None:
     """Reverse path direction when enabled."""
@@ -236,3 +273,25 @@ def test_optimize_path_all_options_together() -> None:
     # Original must not be mutated
     assert str(ante_svg) == test
     assert str(post_svg) == post
+
+
+def test_simplify_arcs() -> None:
+    """Replace arcs that are within the tolerance of their chord by lines."""
+    ante = (
+        "M 0 0 A 100 100 0 0 1 1 0 a 100 50 0 0 0 2 1 A 100 100 0 1 1 4 1 "
+        "A 1 1 0 0 1 7 1 A 0 5 0 0 0 8 8 a 5 0 0 0 0 1 1"
+    )
+    post = (
+        "M 0 0 L 1 0 a 100 50 0 0 0 2 1 A 100 100 0 1 1 4 1 A 1 1 0 0 1 7 1 L 8 8 l 1 1"
+    )
+
+    ante_svg = SvgPath(ante)
+    post_svg = simplify_arcs(ante_svg, "0.01")
+
+    # Original must not be mutated
+    assert str(ante_svg) == ante
+    assert str(post_svg) == post
+
+    # Only arcs with a zero radius are straight for a zero tolerance.
+    post = ante.replace("A 0 5 0 0 0 8 8 a 5 0 0 0 0 1 1", "L 8 8 l 1 1")
+    assert str(simplify_arcs(ante_svg, 0)) == post
@@ -4,6 +4,8 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+from decimal import Decimal
+
 from svg_path_editor import SvgPath
 
 ante = (
@@ -12,7 +14,6 @@ ante = (
     "C 90 130 60 130 40 110 C 20 90 20 60 40 40 Z M 60 70 a 10 15 30 1 1 20 0 "
     "a 10 15 30 1 1 -20 0 z M 80 120 h 20 v 20 h -20 v -20 z"
 )
-print(ante)
 
 
 def test_translation():
@@ -90,3 +91,31 @@ def test_scale():
 
     assert str(ante_svg) == ante
     assert f"{post_svg:.4}" == post
+
+
+def test_identity_transforms():
+    ante_svg = SvgPath(ante)
+
+    assert str(ante_svg.translated(0, "0.0")) == ante
+    assert str(ante_svg.scaled(1, "1.0")) == ante
+    assert str(ante_svg.rotated(10, 20, 360)) == ante
+
+
+def test_identity_transforms_refresh():
+    # Identity transformations still resynchronise directly edited items.
+    path = SvgPath("M 0 0 L 1 1")
+    path.path[1].values[0] = Decimal(5)
+    path.scale(1, 1)
+    assert path.target_locations[1].x == 5
+
+    # Translating by zero normalises negative zeros.
+    assert str(SvgPath("M -0 1 L 2 -0").translated(0, 0)) == "M 0 1 L 2 0"
+
+    # Scaling by one rounds to the context precision, as for any other factor.
+    long = "M 0 0 L 1.000000000000000000000000000001 2"
+    assert SvgPath(long).scaled(1, 1).path[1].values[0] == Decimal(
+        "1.000000000000000000000000000"
+    )
+    assert SvgPath(long).scaled(2, 1).path[1].values[0] == Decimal(
+        "2.000000000000000000000000000"
+    )